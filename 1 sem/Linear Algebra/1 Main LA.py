@@ -1,9 +1,22 @@
+import os
+import sys
+
 import numpy as np
+import matplotlib
+
+# Uden skærm (Linux uden DISPLAY/WAYLAND_DISPLAY, fx batch-kørsel eller CI) bruges Agg,
+# så der ikke startes en GUI. En eksplicit MPLBACKEND fra miljøet har forrang.
+if ("MPLBACKEND" not in os.environ and sys.platform.startswith("linux")
+        and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
 
 # 1️⃣ Lav nogle vektorer
-v = np.array([2, 3])
-w = np.array([1, -1])
+# int32 er rigeligt til små heltal og halverer hukommelsen i forhold til int64
+v = np.array([2, 3], dtype=np.int32)
+w = np.array([1, -1], dtype=np.int32)
 
 print("v =", v)
 print("w =", w)
@@ -13,18 +26,22 @@ print("v + w =", v + w)
 print("2 * v =", 2 * v)
 
 # 3️⃣ Dot product (indre produkt)
-dot = np.dot(v, w)
+dot = int(v[0]) * int(w[0]) + int(v[1]) * int(w[1])  # 2D: skriv summen ud i stedet for np.dot
 print("Dot product v·w =", dot)
 
-# 4️⃣ Visualisér vektorerne
-plt.quiver(0, 0, v[0], v[1], angles='xy', scale_units='xy', scale=1, color='blue', label='v')
-plt.quiver(0, 0, w[0], w[1], angles='xy', scale_units='xy', scale=1, color='red', label='w')
+# 4️⃣ Visualisér vektorerne (begge pile i én quiver fra origo)
+UV = np.stack([v, w])
+colors = ['blue', 'red']
+labels = ['v', 'w']
+O = np.zeros(len(UV), dtype=np.int32)
+plt.quiver(O, O, UV[:, 0], UV[:, 1], angles='xy', scale_units='xy', scale=1, color=colors)
 plt.xlim(-2, 4)
 plt.ylim(-2, 4)
 plt.grid()
-plt.legend()
+# Én quiver giver kun én legend-post, så hver pil får sin egen farvede proxy
+plt.legend(handles=[Patch(color=c, label=l) for c, l in zip(colors, labels)])
 plt.title("Visualisering af vektorer")
-plt.show()
+plt.show()  # gør intet under Agg
 
 
 
@@ -1,26 +1,41 @@
+import os
+import sys
+
 import numpy as np
+import matplotlib
+
+# Uden skærm (Linux uden DISPLAY/WAYLAND_DISPLAY, fx batch-kørsel eller CI) bruges Agg,
+# så der ikke startes en GUI. En eksplicit MPLBACKEND fra miljøet har forrang.
+if ("MPLBACKEND" not in os.environ and sys.platform.startswith("linux")
+        and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
 
 # Enhedsbasis
-e1 = np.array([1, 0])
-e2 = np.array([0, 1])
+# float32 hele vejen, så A @ E forbliver float32
+e1 = np.array([1, 0], dtype=np.float32)
+e2 = np.array([0, 1], dtype=np.float32)
 
 # En matrix, som roterer og skalerer
 A = np.array([[0, -1],
-              [1,  0]])  # 90 graders rotation
+              [1,  0]], dtype=np.float32)  # 90 graders rotation
 
-# Transformér basisvektorerne
-Ae1 = A @ e1
-Ae2 = A @ e2
+# Transformér basisvektorerne (én matmul: søjlerne i AE er A·e1 og A·e2)
+AE = A @ np.stack([e1, e2], axis=1)
+Ae1, Ae2 = AE[:, 0], AE[:, 1]
 
-# Plot originalt og transformeret koordinatsystem
-plt.quiver(0, 0, e1[0], e1[1], color='gray', scale=1, scale_units='xy', angles='xy', label='e1')
-plt.quiver(0, 0, e2[0], e2[1], color='gray', scale=1, scale_units='xy', angles='xy', label='e2')
-plt.quiver(0, 0, Ae1[0], Ae1[1], color='blue', scale=1, scale_units='xy', angles='xy', label='A·e1')
-plt.quiver(0, 0, Ae2[0], Ae2[1], color='red', scale=1, scale_units='xy', angles='xy', label='A·e2')
+# Plot originalt og transformeret koordinatsystem: alle fire pile i én quiver fra origo
+UV = np.stack([e1, e2, Ae1, Ae2])
+colors = ['gray', 'gray', 'blue', 'red']
+labels = ['e1', 'e2', 'A·e1', 'A·e2']
+O = np.zeros(len(UV), dtype=np.float32)
+plt.quiver(O, O, UV[:, 0], UV[:, 1], color=colors, scale=1, scale_units='xy', angles='xy')
 plt.xlim(-2, 2)
 plt.ylim(-2, 2)
 plt.grid()
-plt.legend()
+# Én quiver giver kun én legend-post, så hver pil får sin egen farvede proxy
+plt.legend(handles=[Patch(color=c, label=l) for c, l in zip(colors, labels)])
 plt.title("Matrix som lineær transformation")
-plt.show()
+plt.show()  # gør intet under Agg
@@ -4,13 +4,11 @@ A = np.array([[8, 0, 0],
               [0, 6, 0],
               [2, 1, 3]], dtype=float)
 
-def make_b(d1, d2, d3, d4):
-    c2, c3, c4 = 64.0, 36.0, 14.0
-    return 0.5 * np.array([
-        d1**2 - d2**2 + c2,
-        d1**2 - d3**2 + c3,
-        d1**2 - d4**2 + c4
-    ])
+def make_b(D):
+    # one column of b per distance tuple (row of D); each d is squared once
+    c = np.array([64.0, 36.0, 14.0])
+    D2 = D * D
+    return 0.5 * (D2[:, :1] - D2[:, 1:] + c).T
 
 distances = [
     (3.74, 5.48, 5.10, 2.45),
@@ -18,7 +16,10 @@ distances = [
     (23.45, 18.06, 20.15, 21.35)
 ]
 
-for k, (d1, d2, d3, d4) in enumerate(distances, start=1):
-    b = make_b(d1, d2, d3, d4)
-    x = np.linalg.solve(A, b)
+D = np.asarray(distances, dtype=np.float64)
+B = make_b(D)
+X = np.linalg.solve(A, B)  # A is factored once for all right-hand sides
+
+for k in range(1, D.shape[0] + 1):
+    b, x = B[:, k - 1], X[:, k - 1]
     print(f"k = {k}: b = {b}, x = {x}")
@@ -18,8 +18,37 @@ U = (1 - gamma) * I + beta * A
 
 x0 = np.array([1,0,0,0,0,0], dtype=float)
 
+n = U.shape[0]
+
+# diagonalize once: U^k @ x0 = V @ (w**k * (V^-1 @ x0)), O(n^2) per k
+w, V = np.linalg.eig(U)
+diagonalizable = np.linalg.cond(V) < 1e8
+if diagonalizable:
+    c = np.linalg.solve(V, x0)
+
+def Ukx(U, x, k):
+    # binary exponentiation applied to the vector: U^k itself is never stored
+    result = x.copy()
+    base = U.copy()
+    while k:
+        if k & 1:
+            result = base @ result
+        base = base @ base
+        k >>= 1
+    return result
+
 def Tk(k):
-    return np.linalg.matrix_power(U, k) @ x0
+    if k <= n:
+        # a few matrix-vector steps are exact enough and cheaper than the eigen route
+        x = x0
+        for _ in range(k):
+            x = U @ x
+        return x
+    if not diagonalizable:
+        # (near) defective U: V is too ill-conditioned to trust
+        return Ukx(U, x0, k)
+    # U need not be symmetric, so eig may come back complex
+    return np.real_if_close(V @ (w**k * c))
 
 x1  = Tk(1)
 x25 = Tk(25)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy.polys.matrices import DomainMatrix
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -13,6 +15,7 @@ class InputError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
@@ -50,7 +53,7 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 8) -> int:
         return v
 
 
-def read_square_matrix(n: int, name: str = "A") -> sp.Matrix:
+def read_square_matrix(n: int, name: str = "A") -> sp.ImmutableMatrix:
     print(f"\nEnter matrix {name} row by row ({n} x {n}).")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
     rows = []
@@ -65,18 +68,49 @@ def read_square_matrix(n: int, name: str = "A") -> sp.Matrix:
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 0, -2, 3/4")
-    return sp.Matrix(rows)
+    return sp.ImmutableMatrix(rows)
 
 
-def cofactor_matrix(A: sp.Matrix) -> sp.Matrix:
+def bareiss_adjugate(A: sp.Matrix) -> tuple[sp.Matrix, sp.Rational] | None:
+    """
+    Fraction-free (Bareiss) Gauss-Jordan on [A | I].
+    After the sweep the left block is det*I and the right block is adj(A)
+    (up to the sign from row swaps), so det and adj come out together.
+    Returns None if A is singular (no nonzero pivot found).
+    """
     n = A.rows
-    C = sp.zeros(n, n)
-    for i in range(n):
-        for j in range(n):
-            # Minor M_ij: delete row i and col j
-            M = A.minor_submatrix(i, j)
-            C[i, j] = sp.simplify(((-1) ** (i + j)) * M.det())
-    return C
+    a = [[A[i, j] for j in range(n)] + [sp.Integer(1 if i == j else 0) for j in range(n)]
+         for i in range(n)]
+    sign = 1
+    prev = sp.Integer(1)
+    for k in range(n):
+        if a[k][k] == 0:
+            for r in range(k + 1, n):
+                if a[r][k] != 0:
+                    a[k], a[r] = a[r], a[k]
+                    sign = -sign
+                    break
+            else:
+                return None
+        pivot = a[k][k]
+        row_k = a[k]
+        for i in range(n):
+            if i == k:
+                continue
+            row_i = a[i]
+            aik = row_i[k]
+            a[i] = [(pivot * row_i[j] - aik * row_k[j]) / prev for j in range(2 * n)]
+        prev = pivot
+
+    # left block is now det(PA)*I, right block is det(PA)*(PA)^{-1}*P = sign*adj(A)
+    adj = sp.Matrix([[sign * a[i][n + j] for j in range(n)] for i in range(n)])
+    return adj, sign * prev
+
+
+def singular_adjugate(A: sp.Matrix) -> sp.Matrix:
+    # singular A: adj(A) can still be nonzero, let DomainMatrix handle it over QQ
+    adj, _ = DomainMatrix.from_Matrix(A).to_field().adj_det()
+    return adj.to_Matrix()
 
 
 def main() -> None:
@@ -93,12 +127,16 @@ def main() -> None:
             print("\nA =")
             sp.pprint(A, use_unicode=True)
 
-            detA = sp.simplify(A.det())
+            result = bareiss_adjugate(A)
+            if result is not None:
+                adjA, detA = result
+                C = adjA.T
+            else:
+                detA = sp.Integer(0)
+                adjA = singular_adjugate(A)
+                C = adjA.T
             print(f"\ndet(A) = {detA}")
 
-            C = cofactor_matrix(A)
-            adjA = sp.simplify(C.T)
-
             print("\nCofactor matrix C =")
             sp.pprint(C, use_unicode=True)
 
@@ -106,18 +144,19 @@ def main() -> None:
             sp.pprint(adjA, use_unicode=True)
 
             # Verification identity
-            I = sp.eye(n)
-            left = sp.simplify(A * adjA)
-            right = sp.simplify(detA * I)
+            I = sp.ImmutableMatrix.eye(n)
+            left = A * adjA
+            right = detA * I
 
             print("\nCheck: A * adj(A) =")
             sp.pprint(left, use_unicode=True)
 
             print("\nShould equal det(A) * I =")
             sp.pprint(right, use_unicode=True)
+            print("Identity holds:", (left - right).is_zero_matrix)
 
             if detA != 0:
-                invA = sp.simplify(adjA / detA)
+                invA = adjA / detA  # entries are already exact Rationals
                 print("\nSince det(A) != 0, inverse via adjugate is:")
                 print("A^{-1} = adj(A) / det(A) =")
                 sp.pprint(invA, use_unicode=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
@@ -13,6 +14,7 @@ class InputError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
@@ -68,13 +70,11 @@ def read_augmented_matrix(m: int, n_vars: int) -> sp.Matrix:
     return sp.Matrix(rows)
 
 
-def is_inconsistent_row(row: sp.Matrix, n_vars: int) -> bool:
+def is_inconsistent_row(row: list[sp.Rational], n_vars: int) -> bool:
     """
     Checks if row looks like [0 0 ... 0 | nonzero]
     """
-    left = row[:, :n_vars]
-    b = row[0, n_vars]
-    return all(left[0, j] == 0 for j in range(n_vars)) and b != 0
+    return row[n_vars] != 0 and all(v == 0 for v in row[:n_vars])
 
 
 def back_substitution(Ab: sp.Matrix, n_vars: int) -> tuple[list[sp.Expr], list[int]]:
@@ -92,9 +92,12 @@ def back_substitution(Ab: sp.Matrix, n_vars: int) -> tuple[list[sp.Expr], list[i
     if total_cols != n_vars + 1:
         raise InputError("Augmented matrix has wrong number of columns.")
 
+    # plain list of lists: avoids Matrix.__getitem__ in the loops below
+    rows = Ab.tolist()
+
     # Inconsistency check
     for i in range(m):
-        if is_inconsistent_row(Ab[i, :], n_vars):
+        if is_inconsistent_row(rows[i], n_vars):
             raise InputError("System is inconsistent (row of form 0=nonzero). No solution.")
 
     # Determine pivot columns (simple scan for first nonzero in each row)
@@ -102,7 +105,7 @@ def back_substitution(Ab: sp.Matrix, n_vars: int) -> tuple[list[sp.Expr], list[i
     pivot_cols = set()
     for i in range(m):
         for j in range(n_vars):
-            if Ab[i, j] != 0:
+            if rows[i][j] != 0:
                 pivot_col_for_row[i] = j
                 pivot_cols.add(j)
                 break
@@ -120,11 +123,18 @@ def back_substitution(Ab: sp.Matrix, n_vars: int) -> tuple[list[sp.Expr], list[i
         pc = pivot_col_for_row[i]
         if pc == -1:
             continue  # zero row
-        rhs = Ab[i, n_vars]
+        row = rows[i]
+        pivot = row[pc]
+        rhs = row[n_vars]
         # subtract known terms to the right of pivot
+        # (Rational arithmetic is already canonical, no simplify needed)
         for j in range(pc + 1, n_vars):
-            rhs = sp.simplify(rhs - Ab[i, j] * x[j])
-        x[pc] = sp.simplify(rhs / Ab[i, pc])
+            rhs = rhs - row[j] * x[j]
+        x[pc] = rhs / pivot
+
+    if free_cols:
+        # one normalisation at the end, grouped by parameter for display
+        x = [sp.collect(sp.cancel(e), t) for e in x]
 
     return x, free_cols
 
@@ -1,7 +1,9 @@
 """jeg tror theta rad er den jeg skal kigge på her"""
 
 from __future__ import annotations
+import math
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
@@ -10,11 +12,23 @@ except Exception as e:
     print("Error:", e)
     sys.exit(1)
 
+try:
+    import numpy as np
+except Exception as e:
+    print("Could not import numpy. Install it first with: pip install numpy")
+    print("Error:", e)
+    sys.exit(1)
+
+# Decimal/integer input is handled in float64 (NumPy/BLAS) unless --exact is given.
+# Any fraction like 1/3 in the input switches that run to exact SymPy arithmetic.
+EXACT = "--exact" in sys.argv[1:]
+
 
 class InputError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def parse_num(s: str) -> sp.Rational:
     s = s.strip()
     if s == "":
@@ -40,16 +54,26 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 500) -> int:
         return n
 
 
-def read_vector(n: int, name: str) -> sp.Matrix:
+def read_vector(n: int, name: str) -> sp.ImmutableMatrix | np.ndarray:
     """
     Accepts: "1, -2, 3" or "1 -2 3"
-    Returns n×1 column vector.
+    Returns n×1 column vector, or a float64 array unless EXACT is set
+    or the input has a fraction.
     """
     while True:
         txt = input(f"Enter vector {name} with {n} entries: ").strip()
         if txt.lower() in {"q", "quit", "back"}:
             raise KeyboardInterrupt
         txt = txt.replace(",", " ")
+        if not EXACT and "/" not in txt:
+            # one C-level parse of the whole line; any problem falls through
+            # to the token-by-token path below for a proper error message
+            try:
+                v = np.fromstring(txt, sep=" ")
+                if v.size == n and np.isfinite(v).all():
+                    return v
+            except ValueError:
+                pass
         parts = [p for p in txt.split() if p.strip() != ""]
         if len(parts) != n:
             print(f"❌ Expected {n} numbers, got {len(parts)}.")
@@ -57,11 +81,39 @@ def read_vector(n: int, name: str) -> sp.Matrix:
             continue
         try:
             nums = [parse_num(p) for p in parts]
-            return sp.Matrix(nums)
+            return sp.ImmutableMatrix(nums)
         except InputError as e:
             print(f"❌ {e}")
 
 
+def as_exact(v: sp.ImmutableMatrix | np.ndarray) -> sp.ImmutableMatrix:
+    if isinstance(v, sp.ImmutableMatrix):
+        return v
+    return sp.ImmutableMatrix([sp.Rational(repr(float(x))) for x in v])
+
+
+def numeric_angle(a: np.ndarray, b: np.ndarray) -> None:
+    da = float(np.dot(a, b))
+    na = float(np.linalg.norm(a))
+    nb = float(np.linalg.norm(b))
+
+    if na == 0 or nb == 0:
+        raise InputError("Angle/cosine similarity is undefined if one vector is the zero vector.")
+
+    # rounding can push cos slightly outside [-1, 1]
+    cosv = min(1.0, max(-1.0, da / (na * nb)))
+    theta = math.acos(cosv)
+
+    print("\na =", a)
+    print("b =", b)
+    print("\nDot product a·b =", da)
+    print("||a|| ≈", na)
+    print("||b|| ≈", nb)
+    print("\ncos(theta) ≈", cosv)
+    print("theta (rad) ≈", theta)
+    print("theta (deg) ≈", math.degrees(theta))
+
+
 def dot(a: sp.Matrix, b: sp.Matrix) -> sp.Expr:
     if a.shape != b.shape:
         raise InputError(f"Shape mismatch: a is {a.shape}, b is {b.shape}")
@@ -75,6 +127,7 @@ def norm(v: sp.Matrix) -> sp.Expr:
 def main() -> None:
     print("=== Angle / Cosine Similarity Tool ===")
     print("cos(theta) = (a·b) / (||a|| ||b||)")
+    print("Fractions give exact results. Run with --exact to keep decimals exact too.")
     print("Type 'q' to quit.\n")
 
     while True:
@@ -83,29 +136,34 @@ def main() -> None:
             a = read_vector(n, "a")
             b = read_vector(n, "b")
 
-            print("\na ="); sp.pprint(a, use_unicode=True)
-            print("\nb ="); sp.pprint(b, use_unicode=True)
-
-            da = sp.simplify(dot(a, b))
-            na = sp.simplify(norm(a))
-            nb = sp.simplify(norm(b))
-
-            if na == 0 or nb == 0:
-                raise InputError("Angle/cosine similarity is undefined if one vector is the zero vector.")
-
-            cosv = sp.simplify(da / (na * nb))
-
-            # Sometimes due to simplification, cosv can be slightly outside [-1,1] numerically.
-            # We'll compute angle symbolically and also numeric.
-            theta = sp.acos(cosv)
-            theta_deg = sp.simplify(theta * 180 / sp.pi)
-
-            print("\nDot product a·b =", da)
-            print("||a|| =", na, "≈", sp.N(na))
-            print("||b|| =", nb, "≈", sp.N(nb))
-            print("\ncos(theta) =", cosv, "≈", sp.N(cosv))
-            print("theta (rad) =", sp.simplify(theta), "≈", sp.N(theta))
-            print("theta (deg) =", sp.simplify(theta_deg), "≈", sp.N(theta_deg))
+            if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+                numeric_angle(a, b)
+            else:
+                a, b = as_exact(a), as_exact(b)
+                print("\na ="); sp.pprint(a, use_unicode=True)
+                print("\nb ="); sp.pprint(b, use_unicode=True)
+
+                # Rational arithmetic and sqrt already give canonical forms, no simplify needed
+                da = dot(a, b)
+                na = norm(a)
+                nb = norm(b)
+
+                if na == 0 or nb == 0:
+                    raise InputError("Angle/cosine similarity is undefined if one vector is the zero vector.")
+
+                cosv = da / (na * nb)
+
+                # We'll compute angle symbolically and also numeric.
+                # acos folds the special values itself (acos(0) = pi/2, ...).
+                theta = sp.acos(cosv)
+                theta_deg = theta * 180 / sp.pi
+
+                print("\nDot product a·b =", da)
+                print("||a|| =", na, "≈", sp.N(na))
+                print("||b|| =", nb, "≈", sp.N(nb))
+                print("\ncos(theta) =", cosv, "≈", sp.N(cosv))
+                print("theta (rad) =", theta, "≈", sp.N(theta))
+                print("theta (deg) =", theta_deg, "≈", sp.N(theta_deg))
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
@@ -22,9 +22,11 @@ det(C)=−18
 
 from __future__ import annotations
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy.polys.matrices import DomainMatrix
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -35,6 +37,7 @@ class InputError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
@@ -68,7 +71,7 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 25) -> int:
         return val
 
 
-def read_square_matrix() -> sp.Matrix:
+def read_square_matrix() -> sp.ImmutableMatrix:
     print("\nEnter matrix size (square matrix). Type 'q' to quit.")
     n = read_int("Size n (matrix is n x n): ", 1, 20)
 
@@ -88,7 +91,7 @@ def read_square_matrix() -> sp.Matrix:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
 
-    return sp.Matrix(rows)
+    return sp.ImmutableMatrix(rows)
 
 
 def main() -> None:
@@ -103,7 +106,9 @@ def main() -> None:
             print("\nYou entered A =")
             sp.pprint(A, use_unicode=True)
 
-            d = sp.simplify(A.det())
+            # stay in the rational domain (QQ) instead of generic Expr arithmetic
+            dm = DomainMatrix.from_Matrix(A).to_field()
+            d = dm.domain.to_sympy(dm.det())
             print(f"\ndet(A) = {d}")
             print("Invertible:", d != 0)
 
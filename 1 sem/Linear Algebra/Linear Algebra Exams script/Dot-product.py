@@ -5,6 +5,7 @@ Negativt tal (<0): vektorerne peger mere imod hinanden (vinklen > 90°)"""
 
 from __future__ import annotations
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
@@ -13,11 +14,23 @@ except Exception as e:
     print("Error:", e)
     sys.exit(1)
 
+try:
+    import numpy as np
+except Exception as e:
+    print("Could not import numpy. Install it first with: pip install numpy")
+    print("Error:", e)
+    sys.exit(1)
+
+# Decimal/integer input is handled in float64 (NumPy/BLAS) unless --exact is given.
+# Any fraction like 1/3 in the input switches that run to exact SymPy arithmetic.
+EXACT = "--exact" in sys.argv[1:]
+
 
 class InputError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
@@ -43,10 +56,11 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 200) -> int:
         return val
 
 
-def read_vector(n: int, name: str) -> sp.Matrix:
+def read_vector(n: int, name: str) -> sp.ImmutableMatrix | np.ndarray:
     """
     Reads a vector of length n as a column vector (n x 1).
     Accepts commas or spaces, e.g. "1, 2, -3" or "1 2 -3".
+    Returns a float64 array unless EXACT is set or the input has a fraction.
     """
     while True:
         s = input(f"Enter vector {name} with {n} entries: ").strip()
@@ -54,6 +68,17 @@ def read_vector(n: int, name: str) -> sp.Matrix:
             raise KeyboardInterrupt
 
         s = s.replace(",", " ")
+
+        if not EXACT and "/" not in s:
+            # one C-level parse of the whole line; any problem falls through
+            # to the token-by-token path below for a proper error message
+            try:
+                v = np.fromstring(s, sep=" ")
+                if v.size == n and np.isfinite(v).all():
+                    return v
+            except ValueError:
+                pass
+
         parts = [p for p in s.split() if p.strip() != ""]
         if len(parts) != n:
             print(f"❌ Expected {n} numbers, got {len(parts)}.")
@@ -62,12 +87,18 @@ def read_vector(n: int, name: str) -> sp.Matrix:
 
         try:
             nums = [parse_number(p) for p in parts]
-            return sp.Matrix(nums)  # column vector
+            return sp.ImmutableMatrix(nums)  # column vector
         except InputError as e:
             print(f"❌ {e}")
             print("   Example: 1, 2, -3, 4/5")
 
 
+def as_exact(v: sp.ImmutableMatrix | np.ndarray) -> sp.ImmutableMatrix:
+    if isinstance(v, sp.ImmutableMatrix):
+        return v
+    return sp.ImmutableMatrix([sp.Rational(repr(float(x))) for x in v])
+
+
 def dot_product(a: sp.Matrix, b: sp.Matrix) -> sp.Rational:
     return (a.T * b)[0]
 
@@ -75,7 +106,8 @@ def dot_product(a: sp.Matrix, b: sp.Matrix) -> sp.Rational:
 def main() -> None:
     print("=== Dot Product Tool ===")
     print("Dot product: a·b = sum(a_i * b_i)")
-    print("Fractions are allowed. Type 'q' to quit.\n")
+    print("Fractions are allowed (exact result). Run with --exact to keep decimals exact too.")
+    print("Type 'q' to quit.\n")
 
     while True:
         try:
@@ -83,13 +115,19 @@ def main() -> None:
             a = read_vector(n, "a")
             b = read_vector(n, "b")
 
-            print("\na =")
-            sp.pprint(a, use_unicode=True)
-            print("\nb =")
-            sp.pprint(b, use_unicode=True)
-
-            dp = sp.simplify(dot_product(a, b))
-            print(f"\na·b = {dp}")
+            if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+                print("\na =", a)
+                print("b =", b)
+                print(f"\na·b = {np.dot(a, b)}")
+            else:
+                a, b = as_exact(a), as_exact(b)
+                print("\na =")
+                sp.pprint(a, use_unicode=True)
+                print("\nb =")
+                sp.pprint(b, use_unicode=True)
+
+                dp = sp.simplify(dot_product(a, b))
+                print(f"\na·b = {dp}")
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
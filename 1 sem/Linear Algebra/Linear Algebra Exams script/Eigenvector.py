@@ -1,8 +1,10 @@
 from __future__ import annotations
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy.polys.matrices import DomainMatrix
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -13,6 +15,7 @@ class InputError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
@@ -47,7 +50,7 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 10) -> int:
         return val
 
 
-def read_square_matrix() -> sp.Matrix:
+def read_square_matrix() -> sp.ImmutableMatrix:
     print("\nEnter matrix size (square matrix). Type 'q' to quit.")
     n = read_int("Size n (matrix is n x n): ", 1, 10)
 
@@ -67,7 +70,35 @@ def read_square_matrix() -> sp.Matrix:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
 
-    return sp.Matrix(rows)
+    return sp.ImmutableMatrix(rows)
+
+
+def eigen_pairs(A: sp.Matrix) -> list[tuple[sp.Expr, int, list[sp.Matrix]]]:
+    """
+    Same output as A.eigenvects(), but built from the characteristic polynomial
+    over QQ (DomainMatrix) instead of SymPy's generic eigen routine.
+    The fast path is only taken when every eigenvalue is rational (charpoly
+    splits into linear factors over QQ); otherwise A.eigenvects() is used,
+    since nullspaces of A - r*I with radical r blow up badly
+    (e.g. [[1,1,1,-1],[-2,1,-2,1],[1,2,-2,1],[0,-1,2,-2]], irreducible quartic).
+    """
+    n = A.rows
+    dm = DomainMatrix.from_Matrix(A).to_field()
+    K = dm.domain
+    lam = sp.Symbol("λ")
+    p = sp.Poly([K.to_sympy(c) for c in dm.charpoly()], lam)
+    _, factors = p.factor_list()
+    if any(f.degree() > 1 for f, _ in factors):
+        return A.eigenvects()
+
+    roots = {-f.nth(0) / f.nth(1): mult for f, mult in factors}
+    I = DomainMatrix.eye(n, K)
+    result = []
+    for r in sorted(roots):
+        ns = (dm - I * K.from_sympy(r)).nullspace().to_Matrix()
+        vecs = [ns[i, :].T for i in range(ns.rows)]
+        result.append((r, roots[r], vecs))
+    return result
 
 
 def main() -> None:
@@ -83,7 +114,7 @@ def main() -> None:
             sp.pprint(A, use_unicode=True)
 
             # eigenvects() returns: (eigenvalue, algebraic multiplicity, [eigenvector basis])
-            ev = A.eigenvects()
+            ev = eigen_pairs(A)
 
             if not ev:
                 print("\nNo eigen information returned (unexpected).")
@@ -91,7 +122,9 @@ def main() -> None:
                 print("\nEigenvalues and eigenvectors:")
                 for (lam, mult, vecs) in ev:
                     print("\n" + "-" * 44)
-                    print(f"eigenvalue λ = {sp.simplify(lam)}    (multiplicity = {mult})")
+                    # rational eigenvalues are already in lowest terms; only radicals need tidying
+                    shown = lam if lam.is_Rational else sp.simplify(lam)
+                    print(f"eigenvalue λ = {shown}    (multiplicity = {mult})")
                     print("eigenvector basis:")
                     for v in vecs:
                         sp.pprint(v, use_unicode=True)
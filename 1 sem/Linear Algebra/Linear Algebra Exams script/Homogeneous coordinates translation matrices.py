@@ -1,5 +1,6 @@
 from __future__ import annotations
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
@@ -13,6 +14,7 @@ class InputError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
 def parse_num(s: str) -> sp.Rational:
     s = s.strip()
     if s == "":
@@ -62,8 +64,8 @@ def read_point(d: int, prompt: str) -> sp.Matrix:
 
 
 def to_homogeneous(p: sp.Matrix) -> sp.Matrix:
-    # append 1
-    return p.col_insert(1, sp.Matrix([1])) if p.cols == 1 else sp.Matrix(list(p) + [1])
+    # append 1 below the column vector
+    return p.col_join(sp.Matrix([1]))
 
 
 def from_homogeneous(ph: sp.Matrix, d: int) -> sp.Matrix:
@@ -114,24 +116,23 @@ def main() -> None:
 
             k = read_int("How many translations do you want to apply? (k): ", 1, 20)
 
-            Ts = []
+            translation_matrix = translation_matrix_2d if d == 2 else translation_matrix_3d
+
+            t_sum = sp.zeros(d, 1)
             for i in range(1, k + 1):
                 t = read_point(d, f"Enter translation t{i} (e.g. 3, -1{' , 0' if d==3 else ''}): ")
-                if d == 2:
-                    T = translation_matrix_2d(t[0, 0], t[1, 0])
-                else:
-                    T = translation_matrix_3d(t[0, 0], t[1, 0], t[2, 0])
-                Ts.append(T)
+                t_sum += t
+                T = translation_matrix(*t)
                 print(f"\nT{i} ="); sp.pprint(T, use_unicode=True)
 
             # IMPORTANT: applying t1 then t2 means p' = T2*T1*p
-            T_total = sp.eye(d + 1)
-            for T in Ts:
-                T_total = T * T_total
+            # pure translations compose by adding vectors: T2*T1 = T(t1 + t2)
+            T_total = translation_matrix(*t_sum)
 
-            ph = sp.Matrix(list(p) + [1])  # homogeneous point
-            ph2 = sp.simplify(T_total * ph)
-            p2 = from_homogeneous(ph2, d)
+            ph = to_homogeneous(p)
+            # T_total * p~ for a pure translation is just p + t_sum, no (d+1)x(d+1) product needed
+            p2 = p + t_sum
+            ph2 = to_homogeneous(p2)
 
             print("\nHomogeneous point p~ ="); sp.pprint(ph, use_unicode=True)
             print("\nTotal translation matrix T_total ="); sp.pprint(T_total, use_unicode=True)
@@ -140,7 +141,7 @@ def main() -> None:
 
             # also show inverse quickly
             print("\nInverse translation (undo move) matrix T_total^{-1} =")
-            sp.pprint(sp.simplify(T_total.inv()), use_unicode=True)
+            sp.pprint(translation_matrix(*(-t_sum)), use_unicode=True)
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
@@ -1,22 +1,47 @@
 from __future__ import annotations
+import re
 import sys
+from functools import lru_cache
 
-try:
-    import sympy as sp
-except Exception as e:
-    print("Could not import sympy. Install it first with: pip install sympy")
-    print("Error:", e)
-    sys.exit(1)
+# sympy costs a noticeable cold start; it is imported on first real use
+# so the banner and the first prompt come up (and 'q' exits) without it.
+sp = None
+QQ = None
+DomainMatrix = None
+
+
+def _require_sympy() -> None:
+    global sp, QQ, DomainMatrix
+    if sp is not None:
+        return
+    try:
+        import sympy as sp
+        from sympy import QQ
+        from sympy.polys.matrices import DomainMatrix
+    except Exception as e:
+        print("Could not import sympy. Install it first with: pip install sympy")
+        print("Error:", e)
+        sys.exit(1)
 
 
 class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # exact: supports -3, 1/2, 0.5
     except Exception:
@@ -24,11 +49,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip()
-    for ch in "[](){}":
-        s = s.replace(ch, "")
-    s = s.replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -39,10 +60,11 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 10) -> int:
         s = input(prompt).strip()
         if s.lower() in {"q", "quit", "exit"}:
             raise KeyboardInterrupt
-        if not s.isdigit():
-            print("Please enter a positive integer.")
+        try:
+            v = int(s)  # one pass: validates and converts, "-3" lands in the range check
+        except ValueError:
+            print("Please enter an integer.")
             continue
-        v = int(s)
         if v < min_value or v > max_value:
             print(f"Please enter a number between {min_value} and {max_value}.")
             continue
@@ -52,24 +74,57 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 10) -> int:
 def read_square_matrix(n: int, name: str = "T") -> sp.Matrix:
     print(f"\nEnter matrix {name} row by row ({n} x {n}).")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
-    rows = []
+    print("You can also enter the whole matrix on one line, row after row.")
+    flat: list[sp.Rational] = []
     for i in range(n):
         while True:
             txt = input(f"{name} Row {i+1} (n={n}): ")
             if txt.lower() in {"q", "quit", "exit"}:
                 raise KeyboardInterrupt
             try:
-                rows.append(parse_row(txt, n))
+                parts = _TOK.findall(txt)
+                if i == 0 and n > 1 and len(parts) == n * n:
+                    # whole matrix on one line; anything else is checked row by row
+                    return sp.Matrix(n, n, [parse_number(p) for p in parts])
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 0, 0, 5")
-    return sp.Matrix(rows)
+    return sp.Matrix(n, n, flat)
 
 
 def is_identity(M: sp.Matrix) -> bool:
+    # scan in place instead of building sp.eye(n); diagonal first, it fails fastest
     n = M.rows
-    return M == sp.eye(n)
+    if M.cols != n:
+        return False
+    if any(M[i, i] != 1 for i in range(n)):
+        return False
+    return all(M[i, j] == 0 for i in range(n) for j in range(n) if i != j)
+
+
+def to_qq(M: sp.MatrixBase) -> DomainMatrix:
+    # exact rational domain: elimination on plain int pairs instead of Rational objects
+    return DomainMatrix.from_Matrix(M).convert_to(QQ)
+
+
+# The "Run again?" loop often sees the same T again; cache the eliminations
+# at module scope, keyed on the (hashable) immutable matrix.
+@lru_cache(maxsize=64)
+def _det(T: sp.ImmutableMatrix) -> sp.Expr:
+    return QQ.to_sympy(to_qq(T).det())
+
+
+@lru_cache(maxsize=64)
+def _inv(T: sp.ImmutableMatrix) -> sp.ImmutableMatrix:
+    return to_qq(T).inv().to_Matrix().as_immutable()
+
+
+@lru_cache(maxsize=64)
+def _rref(M: sp.ImmutableMatrix) -> tuple[sp.ImmutableMatrix, tuple[int, ...]]:
+    R, pivots = to_qq(M).rref()
+    return R.to_Matrix().as_immutable(), tuple(pivots)
 
 
 def main() -> None:
@@ -78,48 +133,60 @@ def main() -> None:
     print("Also shows Gauss-Jordan result from [T|I] -> [I|T^{-1}] when possible.")
     print("Type 'q' to quit.\n")
 
+    # big pprint boxes can take longer than the math; intermediates are opt-in
+    verbose = input("Show intermediates? [y/N]: ").strip().lower() in {"y", "yes"}
+
     while True:
         try:
             n = read_int("Matrix size n (square): ", 1, 10)
+            _require_sympy()
             T = read_square_matrix(n, "T")
 
-            print("\nT =")
-            sp.pprint(T, use_unicode=True)
+            if verbose:
+                print("\nT =")
+                sp.pprint(T, use_unicode=True)
 
-            detT = sp.simplify(T.det())
+            T_key = T.as_immutable()
+            # the cached exact det over QQ both decides invertibility and is shown
+            detT = _det(T_key)
             print(f"\ndet(T) = {detT}")
             if detT == 0:
                 print("❌ Not invertible (det(T) = 0).")
             else:
                 print("✅ Invertible (det(T) != 0).")
 
-                # Method 1: direct inverse
-                T_inv = sp.simplify(T.inv())
-                print("\nT^{-1} (direct .inv()) =")
-                sp.pprint(T_inv, use_unicode=True)
-
-                # Method 2: Gauss-Jordan via RREF on augmented matrix [T|I]
+                # Gauss-Jordan via RREF on augmented matrix [T|I]; this already
+                # is the inverse, so a separate .inv() is only a fallback
                 I = sp.eye(n)
                 Aug = T.row_join(I)
-                rrefAug, pivots = Aug.rref()
+                rrefAug, pivots = _rref(Aug.as_immutable())
 
                 left = rrefAug[:, :n]
                 right = rrefAug[:, n:]
 
-                print("\nRREF([T|I]) =")
-                sp.pprint(rrefAug, use_unicode=True)
+                T_inv = right if is_identity(left) else _inv(T_key)
+                print("\nT^{-1} =")
+                sp.pprint(T_inv, use_unicode=True)
 
-                if is_identity(left):
-                    print("\n✅ Left block became I, so the right block is T^{-1}:")
-                    sp.pprint(sp.simplify(right), use_unicode=True)
-                else:
+                if verbose:
+                    print("\nRREF([T|I]) =")
+                    sp.pprint(rrefAug, use_unicode=True)
+
+                if not is_identity(left):
                     print("\n⚠️ Left block did NOT become I (unexpected if det!=0).")
                     print("This can happen in rare cases with symbolic weirdness; direct inverse above is the reference.")
-
-                # Quick verification
-                check = sp.simplify(T * T_inv)
-                print("\nCheck: T * T^{-1} =")
-                sp.pprint(check, use_unicode=True)
+                elif verbose:
+                    # the right block is exactly the T^{-1} printed above
+                    print("\n✅ Left block became I, so the right block is T^{-1}.")
+
+                # Quick verification; both factors are exact, so the product
+                # needs no simplify and is only printed when it is not I
+                check = T_key * sp.ImmutableMatrix(T_inv)
+                if is_identity(check):
+                    print("\n✅ Check: T * T^{-1} = I")
+                else:
+                    print("\nCheck: T * T^{-1} =")
+                    sp.pprint(check, use_unicode=True)
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
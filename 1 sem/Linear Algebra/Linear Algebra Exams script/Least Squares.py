@@ -1,22 +1,49 @@
 from __future__ import annotations
+import re
 import sys
+from functools import lru_cache
 
-try:
-    import sympy as sp
-except Exception as e:
-    print("Could not import sympy. Install it first with: pip install sympy")
-    print("Error:", e)
-    sys.exit(1)
+# sympy costs a noticeable cold start; it is imported on first real use
+# so the banner and the first prompt come up (and 'q' exits) without it.
+sp = None
+QQ = None
+DomainMatrix = None
+DMNonInvertibleMatrixError = None
+
+
+def _require_sympy() -> None:
+    global sp, QQ, DomainMatrix, DMNonInvertibleMatrixError
+    if sp is not None:
+        return
+    try:
+        import sympy as sp
+        from sympy import QQ
+        from sympy.polys.matrices import DomainMatrix
+        from sympy.polys.matrices.exceptions import DMNonInvertibleMatrixError
+    except Exception as e:
+        print("Could not import sympy. Install it first with: pip install sympy")
+        print("Error:", e)
+        sys.exit(1)
 
 
 class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # supports -3, 1/2, 0.5
     except Exception:
@@ -24,11 +51,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip()
-    for ch in "[](){}":
-        s = s.replace(ch, "")
-    s = s.replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -39,10 +62,11 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 200) -> int:
         s = input(prompt).strip()
         if s.lower() in {"q", "quit", "exit"}:
             raise KeyboardInterrupt
-        if not s.isdigit():
-            print("Please enter a positive integer.")
+        try:
+            v = int(s)  # one pass: validates and converts, "-3" lands in the range check
+        except ValueError:
+            print("Please enter an integer.")
             continue
-        v = int(s)
         if v < min_value or v > max_value:
             print(f"Please enter a number between {min_value} and {max_value}.")
             continue
@@ -52,19 +76,24 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 200) -> int:
 def read_matrix(m: int, n: int, name: str) -> sp.Matrix:
     print(f"\nEnter matrix {name} row by row ({m} x {n}).")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
-    rows = []
+    print("You can also enter the whole matrix on one line, row after row.")
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             txt = input(f"{name} Row {i+1} (n={n}): ")
             if txt.lower() in {"q", "quit", "exit"}:
                 raise KeyboardInterrupt
             try:
-                rows.append(parse_row(txt, n))
+                parts = _TOK.findall(txt)
+                if i == 0 and m > 1 and len(parts) == m * n:
+                    # whole matrix on one line; anything else is checked row by row
+                    return sp.Matrix(m, n, [parse_number(p) for p in parts])
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    return sp.Matrix(m, n, flat)
 
 
 def read_vector(m: int, name: str) -> sp.Matrix:
@@ -72,21 +101,51 @@ def read_vector(m: int, name: str) -> sp.Matrix:
         txt = input(f"Enter vector {name} with {m} entries: ").strip()
         if txt.lower() in {"q", "quit", "exit"}:
             raise KeyboardInterrupt
-        txt = txt.replace(",", " ")
-        parts = [p for p in txt.split() if p.strip() != ""]
+        parts = _TOK.findall(txt)
         if len(parts) != m:
             print(f"❌ Expected {m} numbers, got {len(parts)}.")
             print("Example: 1, -2, 3, 4/5")
             continue
         try:
             nums = [parse_number(p) for p in parts]
-            return sp.Matrix(nums)
+            return sp.Matrix(m, 1, nums)
         except InputError as e:
             print(f"❌ {e}")
 
 
-def vec_norm(v: sp.Matrix) -> sp.Expr:
-    return sp.sqrt((v.T * v)[0])
+def to_qq(M: sp.MatrixBase) -> DomainMatrix:
+    # exact rational domain: elimination on plain int pairs instead of Rational objects
+    return DomainMatrix.from_Matrix(M).convert_to(QQ)
+
+
+def _maybe_simplify(x: sp.Expr | sp.MatrixBase) -> sp.Expr | sp.MatrixBase:
+    # input is parsed to Rationals, so results are usually canonical already;
+    # otherwise sp.cancel is enough and far cheaper than sp.simplify
+    if isinstance(x, sp.MatrixBase):
+        return x if all(e.is_Rational for e in x) else x.applyfunc(sp.cancel)
+    return x if x.is_Rational else sp.cancel(x)
+
+
+# The "Run again?" loop often sees the same A, b again; cache the normal
+# equations and their solution at module scope, keyed on immutable matrices.
+@lru_cache(maxsize=64)
+def _normal_equations(A: sp.ImmutableMatrix, b: sp.ImmutableMatrix) -> tuple[sp.ImmutableMatrix, sp.ImmutableMatrix]:
+    Ad, bd = to_qq(A), to_qq(b)
+    At = Ad.transpose()
+    return (At * Ad).to_Matrix().as_immutable(), (At * bd).to_Matrix().as_immutable()
+
+
+@lru_cache(maxsize=64)
+def _solve_normal(AtA: sp.ImmutableMatrix, Atb: sp.ImmutableMatrix) -> sp.Set:
+    # Nonsingular A^T A (the usual case): plain LU solve over QQ, no symbols needed.
+    try:
+        x = to_qq(AtA).lu_solve(to_qq(Atb)).to_Matrix()
+        return sp.FiniteSet(sp.Tuple(*x))
+    except DMNonInvertibleMatrixError:
+        pass
+    # Singular: linsolve gives the whole (parametric) solution set.
+    x_syms = sp.symbols(f"x1:{AtA.cols + 1}")
+    return sp.linsolve((AtA, Atb), *x_syms)
 
 
 def main() -> None:
@@ -95,9 +154,13 @@ def main() -> None:
     print("Shows normal equations: (A^T A)x = A^T b")
     print("Type 'q' to quit.\n")
 
+    # big pprint boxes can take longer than the math; intermediates are opt-in
+    verbose = input("Show intermediates? [y/N]: ").strip().lower() in {"y", "yes"}
+
     while True:
         try:
             m = read_int("Number of rows m (data points): ", 1, 200)
+            _require_sympy()
             n = read_int("Number of columns n (unknowns): ", 1, 50)
 
             if m < n:
@@ -107,20 +170,19 @@ def main() -> None:
             A = read_matrix(m, n, "A")
             b = read_vector(m, "b")
 
-            print("\nA ="); sp.pprint(A, use_unicode=True)
-            print("\nb ="); sp.pprint(b, use_unicode=True)
+            if verbose:
+                print("\nA ="); sp.pprint(A, use_unicode=True)
+                print("\nb ="); sp.pprint(b, use_unicode=True)
 
-            AtA = sp.simplify(A.T * A)
-            Atb = sp.simplify(A.T * b)
+            AtA, Atb = _normal_equations(A.as_immutable(), b.as_immutable())
 
-            print("\nNormal equations:")
-            print("A^T A ="); sp.pprint(AtA, use_unicode=True)
-            print("A^T b ="); sp.pprint(Atb, use_unicode=True)
+            if verbose:
+                print("\nNormal equations:")
+                print("A^T A ="); sp.pprint(AtA, use_unicode=True)
+                print("A^T b ="); sp.pprint(Atb, use_unicode=True)
 
             # Solve normal equations
-            # linsolve gives solution set; if unique, it's a single tuple.
-            x_syms = sp.symbols(f"x1:{n+1}")
-            sol = sp.linsolve((AtA, Atb), *x_syms)
+            sol = _solve_normal(AtA, Atb)
 
             print("\nSolution set for x (from normal equations):")
             sp.pprint(sol, use_unicode=True)
@@ -134,15 +196,18 @@ def main() -> None:
                 pass
 
             if x_star is not None:
-                Ax = sp.simplify(A * x_star)
-                r = sp.simplify(b - Ax)
+                Ax = _maybe_simplify(A * x_star)
+                r = b - Ax
                 print("\nOne least squares solution x* =")
                 sp.pprint(x_star, use_unicode=True)
 
-                print("\nAx* ="); sp.pprint(Ax, use_unicode=True)
-                print("\nResidual r = b - Ax* ="); sp.pprint(r, use_unicode=True)
+                if verbose:
+                    print("\nAx* ="); sp.pprint(Ax, use_unicode=True)
+                    print("\nResidual r = b - Ax* ="); sp.pprint(r, use_unicode=True)
 
-                rn = sp.simplify(vec_norm(r))
+                # r^T r is a single Rational for a unique x*, so its sqrt is
+                # already exact; only a parametric x* needs the cancel
+                rn = sp.sqrt(_maybe_simplify((r.T * r)[0]))
                 print(f"\n||r|| = {rn}   (≈ {sp.N(rn)})")
 
                 # Optional: numeric approximation for x*
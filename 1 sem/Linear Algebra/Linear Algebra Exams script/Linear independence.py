@@ -1,22 +1,46 @@
 from __future__ import annotations
+import re
 import sys
 
-try:
-    import sympy as sp
-except Exception as e:
-    print("Could not import sympy. Install it first with: pip install sympy")
-    print("Error:", e)
-    sys.exit(1)
+# sympy costs a noticeable cold start; it is imported on first real use
+# so the banner and the first prompt come up (and 'q' exits) without it.
+sp = None
+QQ = None
+DomainMatrix = None
+
+
+def _require_sympy() -> None:
+    global sp, QQ, DomainMatrix
+    if sp is not None:
+        return
+    try:
+        import sympy as sp
+        from sympy import QQ
+        from sympy.polys.matrices import DomainMatrix
+    except Exception as e:
+        print("Could not import sympy. Install it first with: pip install sympy")
+        print("Error:", e)
+        sys.exit(1)
 
 
 class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)
     except Exception:
@@ -24,8 +48,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip().replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -36,10 +59,11 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 50) -> int:
         s = input(prompt).strip()
         if s.lower() in {"q", "quit", "exit"}:
             raise KeyboardInterrupt
-        if not s.isdigit():
-            print("Please enter a positive integer.")
+        try:
+            v = int(s)  # one pass: validates and converts, "-3" lands in the range check
+        except ValueError:
+            print("Please enter an integer.")
             continue
-        v = int(s)
         if v < min_value or v > max_value:
             print(f"Please enter a number between {min_value} and {max_value}.")
             continue
@@ -49,17 +73,27 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 50) -> int:
 def read_matrix(m: int, n: int) -> sp.Matrix:
     print("\nEnter the matrix row by row.")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
-    rows: list[list[sp.Rational]] = []
+    print("You can also enter the whole matrix on one line, row after row.")
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             txt = input(f"Row {i+1} (n={n}): ")
             try:
-                rows.append(parse_row(txt, n))
+                parts = _TOK.findall(txt)
+                if i == 0 and m > 1 and len(parts) == m * n:
+                    # whole matrix on one line; anything else is checked row by row
+                    return sp.Matrix(m, n, [parse_number(p) for p in parts])
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    return sp.Matrix(m, n, flat)
+
+
+def to_qq(M: sp.MatrixBase) -> DomainMatrix:
+    # exact rational domain: elimination on plain int pairs instead of Rational objects
+    return DomainMatrix.from_Matrix(M).convert_to(QQ)
 
 
 def main() -> None:
@@ -68,23 +102,30 @@ def main() -> None:
     print("They are linearly independent  <=>  only solution to A*c = 0 is c=0.")
     print("Type 'q' to quit.\n")
 
+    # big pprint boxes can take longer than the math; intermediates are opt-in
+    verbose = input("Show intermediates? [y/N]: ").strip().lower() in {"y", "yes"}
+
     while True:
         try:
             n = read_int("Vector dimension n (rows): ", 1, 50)
+            _require_sympy()
             k = read_int("Number of vectors k (columns): ", 1, 50)
 
             print(f"\nEnter a matrix A of size {n} x {k}.")
             print("Each COLUMN is one vector.")
             A = read_matrix(n, k)
 
-            print("\nYou entered A =")
-            sp.pprint(A, use_unicode=True)
+            if verbose:
+                print("\nYou entered A =")
+                sp.pprint(A, use_unicode=True)
 
-            rrefA, pivots = A.rref()
-            rankA = A.rank()
+            Ad = to_qq(A)
+            rrefAd, pivots = Ad.rref()
+            rankA = len(pivots)  # same elimination, no second pass
 
-            print("\nRREF(A) =")
-            sp.pprint(rrefA, use_unicode=True)
+            if verbose:
+                print("\nRREF(A) =")
+                sp.pprint(rrefAd.to_Matrix(), use_unicode=True)
             print("\nPivot columns:", pivots)
             print("rank(A) =", rankA)
 
@@ -96,9 +137,10 @@ def main() -> None:
                 print("❌ The columns are LINEARLY DEPENDENT.")
 
                 # Find a non-trivial solution to A*c = 0 (nullspace vector)
-                ns = A.nullspace()
-                if ns:
-                    c = ns[0]  # one dependency vector
+                # read it off the RREF we already have; basis vectors are rows
+                N = rrefAd.nullspace()
+                if N.shape[0]:
+                    c = N[:1, :].to_Matrix().T  # one dependency vector
                     print("\nOne dependency (non-trivial) coefficient vector c such that A*c = 0:")
                     sp.pprint(c, use_unicode=True)
                     print("\nThis means: c1*v1 + c2*v2 + ... + ck*vk = 0 (not all ci = 0).")
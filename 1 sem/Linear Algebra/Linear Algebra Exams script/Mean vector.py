@@ -8,24 +8,44 @@ v= [1]
 """
 
 from __future__ import annotations
+import re
 import sys
 
-try:
-    import sympy as sp
-except Exception as e:
-    print("Could not import sympy. Install it first with: pip install sympy")
-    print("Error:", e)
-    sys.exit(1)
+# sympy costs a noticeable cold start; it is imported on first real use
+# so the banner and the first prompt come up (and 'q' exits) without it.
+sp = None
+
+
+def _require_sympy() -> None:
+    global sp
+    if sp is not None:
+        return
+    try:
+        import sympy as sp
+    except Exception as e:
+        print("Could not import sympy. Install it first with: pip install sympy")
+        print("Error:", e)
+        sys.exit(1)
 
 
 class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # exact: supports -3, 1/2, 0.5
     except Exception:
@@ -33,8 +53,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip().replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -45,10 +64,11 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 200) -> int:
         s = input(prompt).strip()
         if s.lower() in {"q", "quit", "exit"}:
             raise KeyboardInterrupt
-        if not s.isdigit():
-            print("Please enter a positive integer.")
+        try:
+            v = int(s)  # one pass: validates and converts, "-3" lands in the range check
+        except ValueError:
+            print("Please enter an integer.")
             continue
-        v = int(s)
         if v < min_value or v > max_value:
             print(f"Please enter a number between {min_value} and {max_value}.")
             continue
@@ -58,22 +78,29 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 200) -> int:
 def read_matrix(m: int, n: int, name: str) -> sp.Matrix:
     print(f"\nEnter matrix {name} row by row ({m} x {n}).")
     print("Each COLUMN is one data vector. Fractions allowed (e.g. 1/3).")
-    rows: list[list[sp.Rational]] = []
+    print("You can also enter the whole matrix on one line, row after row.")
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             txt = input(f"{name} Row {i+1} (n={n}): ")
             try:
-                rows.append(parse_row(txt, n))
+                parts = _TOK.findall(txt)
+                if i == 0 and m > 1 and len(parts) == m * n:
+                    # whole matrix on one line; anything else is checked row by row
+                    return sp.Matrix(m, n, [parse_number(p) for p in parts])
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    return sp.Matrix(m, n, flat)
 
 
 def mean_of_columns(A: sp.Matrix) -> sp.Matrix:
-    # sum columns: A * ones(n,1) gives an m×1 vector of column sums
-    return sp.simplify((A * sp.ones(A.cols, 1)) / A.cols)
+    # plain row sums scaled once by 1/k; no ones(k,1) matrix or matmul.
+    # Entries are Rationals, so the result is already canonical.
+    inv_k = sp.Rational(1, A.cols)
+    return sp.Matrix(A.rows, 1, [sum(A.row(i), sp.S.Zero) * inv_k for i in range(A.rows)])
 
 
 def main() -> None:
@@ -81,20 +108,25 @@ def main() -> None:
     print("Computes μ = (1/k) * (v1 + ... + vk) where v1..vk are the columns of A.")
     print("Type 'q' to quit.\n")
 
+    # big pprint boxes can take longer than the math; intermediates are opt-in
+    verbose = input("Show intermediates? [y/N]: ").strip().lower() in {"y", "yes"}
+
     while True:
         try:
             m = read_int("Vector dimension m (rows): ", 1, 200)
+            _require_sympy()
             k = read_int("Number of vectors k (columns): ", 1, 200)
 
             A = read_matrix(m, k, "A")
-            print("\nA ="); sp.pprint(A, use_unicode=True)
+            if verbose:
+                print("\nA ="); sp.pprint(A, use_unicode=True)
 
             mu = mean_of_columns(A)
             print("\nMean vector μ (average of columns) =")
             sp.pprint(mu, use_unicode=True)
 
             # handy for copying
-            print("\nAs entries:", [sp.simplify(mu[i, 0]) for i in range(mu.rows)])
+            print("\nAs entries:", list(mu))
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
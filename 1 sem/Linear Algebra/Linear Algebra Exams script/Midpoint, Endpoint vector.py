@@ -69,7 +69,8 @@ def main() -> None:
                 xm, ym = midpoint(x1, y1, x2, y2)
                 print("\nAnswer:")
                 print(f"Midpoint = ({xm}, {ym})")
-                print(f"≈ ({sp.N(xm)}, {sp.N(ym)})")
+                xm_n, ym_n = sp.Matrix([xm, ym]).evalf()
+                print(f"≈ ({xm_n}, {ym_n})")
 
             elif choice == "2":
                 print("\n--- Endpoint ---")
@@ -81,7 +82,8 @@ def main() -> None:
                 x2, y2 = endpoint_from_midpoint(x1, y1, xmid, ymid)
                 print("\nAnswer:")
                 print(f"Endpoint = ({x2}, {y2})")
-                print(f"≈ ({sp.N(x2)}, {sp.N(y2)})")
+                x2_n, y2_n = sp.Matrix([x2, y2]).evalf()
+                print(f"≈ ({x2_n}, {y2_n})")
 
             else:
                 print("Invalid choice. Pick 1 or 2.")
@@ -1,22 +1,42 @@
 from __future__ import annotations
+import re
 import sys
 
-try:
-    import sympy as sp
-except Exception as e:
-    print("Could not import sympy. Install it first with: pip install sympy")
-    print("Error:", e)
-    sys.exit(1)
+# sympy costs a noticeable cold start; it is imported on first real use
+# so the banner and the first prompt come up (and 'q' exits) without it.
+sp = None
+
+
+def _require_sympy() -> None:
+    global sp
+    if sp is not None:
+        return
+    try:
+        import sympy as sp
+    except Exception as e:
+        print("Could not import sympy. Install it first with: pip install sympy")
+        print("Error:", e)
+        sys.exit(1)
 
 
 class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
 def parse_num(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # exact: supports -3, 1/2, 0.5
     except Exception:
@@ -28,10 +48,11 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 200) -> int:
         s = input(prompt).strip()
         if s.lower() in {"q", "quit", "exit"}:
             raise KeyboardInterrupt
-        if not s.isdigit():
-            print("Please enter a positive integer.")
+        try:
+            v = int(s)  # one pass: validates and converts, "-3" lands in the range check
+        except ValueError:
+            print("Please enter an integer.")
             continue
-        v = int(s)
         if v < min_value or v > max_value:
             print(f"Please enter a number between {min_value} and {max_value}.")
             continue
@@ -47,15 +68,14 @@ def read_vector(n: int, name: str) -> sp.Matrix:
         txt = input(f"Enter vector {name} with {n} entries: ").strip()
         if txt.lower() in {"q", "quit", "back"}:
             raise KeyboardInterrupt
-        txt = txt.replace(",", " ")
-        parts = [p for p in txt.split() if p.strip() != ""]
+        parts = _TOK.findall(txt)
         if len(parts) != n:
             print(f"❌ Expected {n} numbers, got {len(parts)}.")
             print("   Example: 1, -2, 3, 4/5")
             continue
         try:
             nums = [parse_num(p) for p in parts]
-            return sp.Matrix(nums)
+            return sp.Matrix(n, 1, nums)
         except InputError as e:
             print(f"❌ {e}")
 
@@ -66,8 +86,12 @@ def dot(a: sp.Matrix, b: sp.Matrix) -> sp.Expr:
     return (a.T * b)[0]
 
 
-def norm(v: sp.Matrix) -> sp.Expr:
-    return sp.sqrt((v.T * v)[0])
+def _maybe_simplify(x: sp.Expr | sp.MatrixBase) -> sp.Expr | sp.MatrixBase:
+    # input is parsed to Rationals, so results are usually canonical already;
+    # otherwise sp.cancel is enough and far cheaper than sp.simplify
+    if isinstance(x, sp.MatrixBase):
+        return x if all(e.is_Rational for e in x) else x.applyfunc(sp.cancel)
+    return x if x.is_Rational else sp.cancel(x)
 
 
 def main() -> None:
@@ -76,6 +100,9 @@ def main() -> None:
     print("Orthonormal set means: pairwise orthogonal AND each has norm 1")
     print("Type 'q' to quit.\n")
 
+    # big pprint boxes can take longer than the math; intermediates are opt-in
+    verbose = input("Show intermediates? [y/N]: ").strip().lower() in {"y", "yes"}
+
     while True:
         try:
             print("Choose mode:")
@@ -87,15 +114,17 @@ def main() -> None:
             if choice in {"0", "q", "quit", "exit"}:
                 print("Bye!")
                 return
+            _require_sympy()
 
             if choice == "1":
                 n = read_int("Vector length n: ", 1, 200)
                 a = read_vector(n, "a")
                 b = read_vector(n, "b")
 
-                da = sp.simplify(dot(a, b))
-                print("\na ="); sp.pprint(a, use_unicode=True)
-                print("\nb ="); sp.pprint(b, use_unicode=True)
+                da = _maybe_simplify(dot(a, b))
+                if verbose:
+                    print("\na ="); sp.pprint(a, use_unicode=True)
+                    print("\nb ="); sp.pprint(b, use_unicode=True)
                 print(f"\na·b = {da}")
 
                 if da == 0:
@@ -111,31 +140,25 @@ def main() -> None:
                 for i in range(1, k + 1):
                     vecs.append(read_vector(n, f"v{i}"))
 
-                # Gram matrix G_ij = v_i · v_j
-                G = sp.zeros(k, k)
-                for i in range(k):
-                    for j in range(k):
-                        G[i, j] = sp.simplify(dot(vecs[i], vecs[j]))
+                # Gram matrix G_ij = v_i · v_j, all at once as V^T V
+                V = sp.Matrix.hstack(*vecs)
+                G = _maybe_simplify(V.T * V)
 
-                print("\nDot product table (Gram matrix G where G[i,j]=vi·vj):")
-                sp.pprint(G, use_unicode=True)
+                if verbose:
+                    print("\nDot product table (Gram matrix G where G[i,j]=vi·vj):")
+                    sp.pprint(G, use_unicode=True)
 
                 # Orthogonal if off-diagonals are 0
-                orthogonal = True
-                for i in range(k):
-                    for j in range(k):
-                        if i != j and G[i, j] != 0:
-                            orthogonal = False
-                            break
-                    if not orthogonal:
-                        break
-
-                norms = [sp.simplify(norm(v)) for v in vecs]
+                orthogonal = (G - sp.diag(*[G[i, i] for i in range(k)])).is_zero_matrix
+
+                # ||v_i||^2 is already on the diagonal of G
+                norms = [sp.sqrt(G[i, i]) for i in range(k)]
                 orthonormal = orthogonal and all(ni == 1 for ni in norms)
 
                 print("\nNorms:")
-                for i, ni in enumerate(norms, start=1):
-                    print(f"||v{i}|| = {ni}  (≈ {sp.N(ni)})")
+                norms_n = sp.Matrix(norms).evalf()
+                for i, (ni, nif) in enumerate(zip(norms, norms_n), start=1):
+                    print(f"||v{i}|| = {ni}  (≈ {nif})")
 
                 if orthogonal:
                     print("\n✅ The set is ORTHOGONAL (all pairwise dot products are 0).")
@@ -1,8 +1,13 @@
 from __future__ import annotations
+import io
+import re
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy import QQ
+    from sympy.polys.matrices import DomainMatrix
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -13,10 +18,21 @@ class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # exact (fractions allowed)
     except Exception:
@@ -24,8 +40,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip().replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -55,18 +70,18 @@ def read_matrix() -> sp.Matrix:
     print("You can separate numbers with spaces or commas.")
     print("Fractions are allowed (e.g. 1/3).")
 
-    rows: list[list[sp.Rational]] = []
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             row_text = input(f"Row {i+1} (n={n}): ")
             try:
-                row = parse_row(row_text, n)
-                rows.append(row)
+                flat.extend(parse_row(row_text, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    # entries are already Rationals: hand the fresh flat list over without re-sympifying
+    return sp.Matrix._new(m, n, flat, copy=False)
 
 
 def ref(A: sp.Matrix) -> tuple[sp.Matrix, tuple[int, ...]]:
@@ -76,8 +91,10 @@ def ref(A: sp.Matrix) -> tuple[sp.Matrix, tuple[int, ...]]:
     - We make entries below pivots zero.
     Returns: (REF_matrix, pivot_columns)
     """
-    M = A.copy()
-    m, n = M.rows, M.cols
+    # eliminate on the polys backend's QQ elements (gmpy2 mpq when available);
+    # echelon_form() is fraction-free and would print scaled rows instead
+    m, n = A.rows, A.cols
+    M = DomainMatrix.from_Matrix(A).convert_to(QQ).to_list()
     pivot_cols: list[int] = []
 
     pivot_row = 0
@@ -86,47 +103,54 @@ def ref(A: sp.Matrix) -> tuple[sp.Matrix, tuple[int, ...]]:
             break
 
         # find a non-zero pivot at or below pivot_row
-        pivot = None
-        for r in range(pivot_row, m):
-            if M[r, col] != 0:
-                pivot = r
-                break
+        pivot = next((r for r in range(pivot_row, m) if M[r][col]), None)
         if pivot is None:
             continue
 
         # swap pivot into place
         if pivot != pivot_row:
-            M.row_swap(pivot, pivot_row)
+            M[pivot], M[pivot_row] = M[pivot_row], M[pivot]
 
-        pivot_val = M[pivot_row, col]
+        # the pivot row's active part is fixed for this column: slice it once
+        ptail = tuple(M[pivot_row][col:])
+        pivot_val = ptail[0]
         pivot_cols.append(col)
 
-        # eliminate below pivot
+        # eliminate below pivot; columns left of col are already zero
         for r in range(pivot_row + 1, m):
-            if M[r, col] == 0:
+            row = M[r]
+            if row[col] == 0:
                 continue
-            factor = sp.simplify(M[r, col] / pivot_val)
-
-            # IMPORTANT: row_op signature is f(value, column_index)
-            M.row_op(r, lambda val, j: sp.simplify(val - factor * M[pivot_row, j]))
+            factor = row[col] / pivot_val
+            # whole-row update in one slice assignment
+            row[col:] = [v - factor * p for v, p in zip(row[col:], ptail)]
 
         pivot_row += 1
 
-    return M, tuple(pivot_cols)
+        # nothing left to reduce once the trailing block is all zero
+        if not any(v for row in M[pivot_row:] for v in row[col + 1:]):
+            break
+
+    E = DomainMatrix(M, (m, n), QQ).to_Matrix()
+    return E, tuple(pivot_cols)
 
 
 def main() -> None:
     print("=== REF Tool (Row Echelon Form) ===")
     while True:
         try:
+            buf = io.StringIO()
             A = read_matrix()
-            print("\nYou entered A =")
-            sp.pprint(A, use_unicode=True)
+            print("\nYou entered A =", file=buf)
+            print(sp.pretty(A, use_unicode=True), file=buf)
 
             E, pivots = ref(A)
-            print("\nREF(A) =")
-            sp.pprint(E, use_unicode=True)
-            print("\nPivot columns:", pivots)
+            print("\nREF(A) =", file=buf)
+            print(sp.pretty(E, use_unicode=True), file=buf)
+            print("\nPivot columns:", pivots, file=buf)
+
+            # one write per run instead of many small ones
+            sys.stdout.write(buf.getvalue())
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
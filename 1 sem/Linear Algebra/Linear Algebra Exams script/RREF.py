@@ -1,8 +1,13 @@
 from __future__ import annotations
+import io
+import re
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy import QQ
+    from sympy.polys.matrices import DomainMatrix
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -13,10 +18,21 @@ class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         # Exact arithmetic (fractions allowed: 1/3)
         return sp.Rational(token)
@@ -25,9 +41,8 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    # Accept "1,2,3" or "1 2 3"
-    s = row_text.strip().replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    # Accept "1,2,3", "1 2 3" or "[1, 2, 3]"
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -56,32 +71,42 @@ def read_matrix() -> sp.Matrix:
     print("\nEnter the matrix row by row.")
     print("You can separate numbers with spaces or commas.")
     print("Fractions are allowed (e.g. 1/3).")
-    rows: list[list[sp.Rational]] = []
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             row_text = input(f"Row {i+1} (n={n}): ")
             try:
-                row = parse_row(row_text, n)
-                rows.append(row)
+                flat.extend(parse_row(row_text, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    # entries are already Rationals: hand the fresh flat list over without re-sympifying
+    return sp.Matrix._new(m, n, flat, copy=False)
+
+
+def to_qq(M: sp.MatrixBase) -> DomainMatrix:
+    # exact rational domain: elimination on plain int pairs instead of Rational objects
+    return DomainMatrix.from_Matrix(M).convert_to(QQ)
 
 
 def main() -> None:
     print("=== RREF Tool (Row Reduced Echelon Form) ===")
     while True:
         try:
+            buf = io.StringIO()
             A = read_matrix()
-            print("\nYou entered A =")
-            sp.pprint(A, use_unicode=True)
+            print("\nYou entered A =", file=buf)
+            print(sp.pretty(A, use_unicode=True), file=buf)
+
+            Rd, pivots = to_qq(A).rref()
+            R = Rd.to_Matrix()
+            print("\nRREF(A) =", file=buf)
+            print(sp.pretty(R, use_unicode=True), file=buf)
+            print("\nPivot columns:", pivots, file=buf)
 
-            R, pivots = A.rref()
-            print("\nRREF(A) =")
-            sp.pprint(R, use_unicode=True)
-            print("\nPivot columns:", pivots)
+            # one write per run instead of many small ones
+            sys.stdout.write(buf.getvalue())
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
@@ -1,8 +1,13 @@
 from __future__ import annotations
+import io
+import re
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy import QQ
+    from sympy.polys.matrices import DomainMatrix
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -13,10 +18,21 @@ class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # exact: supports 1/3, -2, 0.5
     except Exception:
@@ -24,8 +40,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip().replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -49,17 +64,18 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 50) -> int:
 def read_matrix(m: int, n: int, name: str) -> sp.Matrix:
     print(f"\nEnter matrix {name} row by row ({m} x {n}).")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
-    rows: list[list[sp.Rational]] = []
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             txt = input(f"{name} Row {i+1} (n={n}): ")
             try:
-                rows.append(parse_row(txt, n))
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    # entries are already Rationals: hand the fresh flat list over without re-sympifying
+    return sp.Matrix._new(m, n, flat, copy=False)
 
 
 def read_vector(n: int, name: str) -> sp.Matrix:
@@ -67,25 +83,30 @@ def read_vector(n: int, name: str) -> sp.Matrix:
         txt = input(f"Enter vector {name} with {n} entries: ").strip()
         if txt.lower() in {"q", "quit", "back"}:
             raise KeyboardInterrupt
-        txt = txt.replace(",", " ")
-        parts = [p for p in txt.split() if p.strip() != ""]
+        parts = _TOK.findall(txt)
         if len(parts) != n:
             print(f"❌ Expected {n} numbers, got {len(parts)}.")
             print("Example: 1, -2, 3, 4/5")
             continue
         try:
             nums = [parse_number(p) for p in parts]
-            return sp.Matrix(nums)
+            return sp.Matrix._new(n, 1, nums, copy=False)
         except InputError as e:
             print(f"❌ {e}")
 
 
+def to_qq(M: sp.MatrixBase) -> DomainMatrix:
+    # exact rational domain: elimination on plain int pairs instead of Rational objects
+    return DomainMatrix.from_Matrix(M).convert_to(QQ)
+
+
 def main() -> None:
     print("=== Rank Tool ===")
     print("Type 'q' to quit.\n")
 
     while True:
         try:
+            buf = io.StringIO()
             print("Choose mode:")
             print("1) Rank of a matrix A")
             print("2) Rank(D) and Rank([D|s]) (append s as last column)")
@@ -100,13 +121,14 @@ def main() -> None:
                 m = read_int("Rows m: ", 1, 50)
                 n = read_int("Cols n: ", 1, 50)
                 A = read_matrix(m, n, "A")
-                print("\nA ="); sp.pprint(A, use_unicode=True)
+                print("\nA =", file=buf); print(sp.pretty(A, use_unicode=True), file=buf)
 
-                r = A.rank()
-                rrefA, pivots = A.rref()
-                print(f"\nrank(A) = {r}")
-                print("Pivot columns:", pivots)
-                print("\nRREF(A) ="); sp.pprint(rrefA, use_unicode=True)
+                rrefAd, pivots = to_qq(A).rref()
+                rrefA = rrefAd.to_Matrix()
+                r = len(pivots)
+                print(f"\nrank(A) = {r}", file=buf)
+                print("Pivot columns:", pivots, file=buf)
+                print("\nRREF(A) =", file=buf); print(sp.pretty(rrefA, use_unicode=True), file=buf)
 
             elif choice == "2":
                 n_rows = read_int("Number of rows (dimension) n: ", 1, 50)
@@ -115,26 +137,33 @@ def main() -> None:
                 D = read_matrix(n_rows, k, "D")
                 s = read_vector(n_rows, "s")
 
-                print("\nD ="); sp.pprint(D, use_unicode=True)
-                print("\ns ="); sp.pprint(s, use_unicode=True)
+                print("\nD =", file=buf); print(sp.pretty(D, use_unicode=True), file=buf)
+                print("\ns =", file=buf); print(sp.pretty(s, use_unicode=True), file=buf)
 
+                # one elimination: the left k columns of RREF([D|s]) are RREF(D)
                 Aug = D.row_join(s)
-                rD = D.rank()
-                rAug = Aug.rank()
+                rrefAugd, Apivots = to_qq(Aug).rref()
+                rrefAug = rrefAugd.to_Matrix()
+                rrefD = rrefAug[:, :k]
+                rD = sum(1 for p in Apivots if p < k)
+                rAug = len(Apivots)
 
-                print(f"\nrank(D) = {rD}")
-                print(f"rank([D|s]) = {rAug}")
+                print(f"\nrank(D) = {rD}", file=buf)
+                print(f"rank([D|s]) = {rAug}", file=buf)
 
                 if rD == rAug:
-                    print("✅ ranks are equal → s does NOT increase rank (often means s is in span(D)).")
+                    print("✅ ranks are equal → s does NOT increase rank (often means s is in span(D)).", file=buf)
                 else:
-                    print("❌ rank increased → s adds a new independent direction (not in span(D)).")
+                    print("❌ rank increased → s adds a new independent direction (not in span(D)).", file=buf)
 
-                print("\nRREF(D) ="); sp.pprint(D.rref()[0], use_unicode=True)
-                print("\nRREF([D|s]) ="); sp.pprint(Aug.rref()[0], use_unicode=True)
+                print("\nRREF(D) =", file=buf); print(sp.pretty(rrefD, use_unicode=True), file=buf)
+                print("\nRREF([D|s]) =", file=buf); print(sp.pretty(rrefAug, use_unicode=True), file=buf)
 
             else:
-                print("Invalid choice.")
+                print("Invalid choice.", file=buf)
+
+            # one write per run instead of many small ones
+            sys.stdout.write(buf.getvalue())
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
@@ -5,10 +5,15 @@ m = columns
 """
 
 from __future__ import annotations
+import io
+import re
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy import QQ
+    from sympy.polys.matrices import DomainMatrix
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -19,10 +24,21 @@ class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # exact: supports 1/3, -2, 0.5
     except Exception:
@@ -30,8 +46,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip().replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -55,17 +70,18 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 50) -> int:
 def read_matrix(m: int, n: int, name: str) -> sp.Matrix:
     print(f"\nEnter matrix {name} row by row ({m} x {n}).")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
-    rows: list[list[sp.Rational]] = []
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             txt = input(f"{name} Row {i+1} (n={n}): ")
             try:
-                rows.append(parse_row(txt, n))
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    # entries are already Rationals: hand the fresh flat list over without re-sympifying
+    return sp.Matrix._new(m, n, flat, copy=False)
 
 
 def read_vector(n: int, name: str) -> sp.Matrix:
@@ -73,19 +89,37 @@ def read_vector(n: int, name: str) -> sp.Matrix:
         txt = input(f"Enter vector {name} with {n} entries: ").strip()
         if txt.lower() in {"q", "quit", "back"}:
             raise KeyboardInterrupt
-        txt = txt.replace(",", " ")
-        parts = [p for p in txt.split() if p.strip() != ""]
+        parts = _TOK.findall(txt)
         if len(parts) != n:
             print(f"❌ Expected {n} numbers, got {len(parts)}.")
             print("Example: 1, -2, 3, 4/5")
             continue
         try:
             nums = [parse_number(p) for p in parts]
-            return sp.Matrix(nums)  # column vector
+            return sp.Matrix._new(n, 1, nums, copy=False)  # column vector
         except InputError as e:
             print(f"❌ {e}")
 
 
+def to_qq(M: sp.MatrixBase) -> DomainMatrix:
+    # exact rational domain: elimination on plain int pairs instead of Rational objects
+    return DomainMatrix.from_Matrix(M).convert_to(QQ)
+
+
+def solution_from_rref(R: sp.Matrix, pivots: tuple[int, ...], k: int) -> sp.Tuple:
+    """
+    General solution of a consistent D*c = s, read off R = RREF([D|s]).
+    Free columns stay as their own symbol c_j, the same form linsolve gives.
+    """
+    c = sp.symbols(f"c1:{k+1}")
+    sol = list(c)
+    for row, p in enumerate(pivots):
+        sol[p] = R[row, k] - sum(
+            (R[row, j] * c[j] for j in range(p + 1, k) if j not in pivots), sp.S.Zero
+        )
+    return sp.Tuple(*sol)
+
+
 def main() -> None:
     print("=== Span Membership Tool ===")
     print("Checks whether s is in span(columns of D).")
@@ -94,6 +128,7 @@ def main() -> None:
 
     while True:
         try:
+            buf = io.StringIO()
             n = read_int("Vector dimension n (rows): ", 1, 50)
             k = read_int("Number of spanning vectors k (columns of D): ", 1, 50)
 
@@ -101,42 +136,49 @@ def main() -> None:
             D = read_matrix(n, k, "D")
             s = read_vector(n, "s")
 
-            print("\nD ="); sp.pprint(D, use_unicode=True)
-            print("\ns ="); sp.pprint(s, use_unicode=True)
+            print("\nD =", file=buf); print(sp.pretty(D, use_unicode=True), file=buf)
+            print("\ns =", file=buf); print(sp.pretty(s, use_unicode=True), file=buf)
 
+            # one elimination: pivots of [D|s] left of the last column are D's
             Aug = D.row_join(s)
-            rank_D = D.rank()
-            rank_Aug = Aug.rank()
+            rrefAugd, Apivots = to_qq(Aug).rref()
+            rank_D = sum(1 for p in Apivots if p < k)
+            rank_Aug = len(Apivots)
 
-            print(f"\nrank(D) = {rank_D}")
-            print(f"rank([D|s]) = {rank_Aug}")
+            print(f"\nrank(D) = {rank_D}", file=buf)
+            print(f"rank([D|s]) = {rank_Aug}", file=buf)
 
             if rank_D != rank_Aug:
-                print("\n❌ Result: s is NOT in span(D). (System is inconsistent)")
+                print("\n❌ Result: s is NOT in span(D). (System is inconsistent)", file=buf)
             else:
-                print("\n✅ Result: s IS in span(D). (System is consistent)")
+                print("\n✅ Result: s IS in span(D). (System is consistent)", file=buf)
 
-                # Solve D*c = s
-                c_symbols = sp.symbols(f"c1:{k+1}")
-                sol_set = sp.linsolve((D, s), *c_symbols)
+                # Solve D*c = s straight from RREF([D|s]) instead of linsolve
+                sol_set = sp.FiniteSet(solution_from_rref(rrefAugd.to_Matrix(), Apivots, k))
 
-                print("\nOne solution set for coefficients c (where D*c = s):")
-                sp.pprint(sol_set, use_unicode=True)
+                print("\nOne solution set for coefficients c (where D*c = s):", file=buf)
+                print(sp.pretty(sol_set, use_unicode=True), file=buf)
 
                 # If you want one concrete solution (pick parameters = 0)
                 # SymPy often uses t0, t1, ... for free vars
                 try:
                     sol_tuple = next(iter(sol_set))  # one tuple expression
-                    free_syms = set().union(*[expr.free_symbols for expr in sol_tuple])
+                    free_syms = set()
+                    for expr in sol_tuple:
+                        free_syms |= expr.free_symbols
                     # remove the coefficient symbols themselves (shouldn't be in tuple)
                     subs = {sym: 0 for sym in free_syms if str(sym).startswith("t")}
-                    particular = [sp.simplify(expr.subs(subs)) for expr in sol_tuple]
-                    print("\nA particular solution (setting parameters t0,t1,... = 0):")
+                    # exact rational coefficients: a plain xreplace is already canonical
+                    particular = [expr.xreplace(subs) for expr in sol_tuple]
+                    print("\nA particular solution (setting parameters t0,t1,... = 0):", file=buf)
                     for i, val in enumerate(particular, start=1):
-                        print(f"c{i} = {val}")
+                        print(f"c{i} = {val}", file=buf)
                 except Exception:
                     pass
 
+            # one write per run instead of many small ones
+            sys.stdout.write(buf.getvalue())
+
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
                 print("Bye!")
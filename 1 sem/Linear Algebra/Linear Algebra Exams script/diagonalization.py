@@ -1,5 +1,7 @@
 from __future__ import annotations
+import re
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
@@ -13,10 +15,21 @@ class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # supports -3, 1/2, 0.5
     except Exception:
@@ -24,11 +37,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip()
-    for ch in "[](){}":
-        s = s.replace(ch, "")
-    s = s.replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -53,31 +62,65 @@ def read_int(prompt: str, min_value: int = 0, max_value: int = 50) -> int:
 def read_square_matrix(n: int, name: str = "A") -> sp.Matrix:
     print(f"\nEnter matrix {name} row by row ({n} x {n}).")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
-    rows = []
+    flat: list[sp.Rational] = []
     for i in range(n):
         while True:
             txt = input(f"{name} Row {i+1} (n={n}): ")
             if txt.lower() in {"q", "quit", "exit"}:
                 raise KeyboardInterrupt
             try:
-                rows.append(parse_row(txt, n))
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 0, -2, 3/4")
-    return sp.Matrix(rows)
+    # entries are already Rationals: hand the fresh flat list over without re-sympifying
+    return sp.Matrix._new(n, n, flat, copy=False)
 
 
-def try_diagonalize(A: sp.Matrix):
+def _small_inv(P: sp.Matrix) -> sp.Matrix:
+    """
+    Closed-form inverse for the usual exam sizes n = 1, 2, 3 (adjugate / det).
+    """
+    n = P.rows
+    if n == 1:
+        return sp.Matrix([[1 / P[0, 0]]])
+    if n == 2:
+        a, b, c, d = P
+        return sp.Matrix([[d, -b], [-c, a]]) / (a * d - b * c)
+    a, b, c, d, e, f, g, h, i = P
+    A_, B_, C_ = e * i - f * h, f * g - d * i, d * h - e * g
+    det = a * A_ + b * B_ + c * C_
+    adj = sp.Matrix([
+        [A_, c * h - b * i, b * f - c * e],
+        [B_, a * i - c * g, c * d - a * f],
+        [C_, b * g - a * h, a * e - b * d],
+    ])
+    return adj / det
+
+
+# "Run again" often re-examines the same A; cache the eigen work on the
+# (hashable) immutable matrix.
+@lru_cache(maxsize=32)
+def eigen_triples(A: sp.ImmutableMatrix) -> tuple:
+    return tuple(A.eigenvects())
+
+
+def try_diagonalize(A: sp.ImmutableMatrix):
     """
     Returns (P, D) if diagonalizable, else None.
+    Built from the cached eigenvects() triples, the same way A.diagonalize()
+    does it, so the eigenpairs are not computed twice.
     """
-    try:
-        # reals_only=False allows complex eigenvalues if needed
-        P, D = A.diagonalize(reals_only=False)
-        return sp.simplify(P), sp.simplify(D)
-    except Exception:
-        return None
+    p_cols, diag = [], []
+    for lam, mult, vecs in eigen_triples(A):
+        # complex eigenvalues are fine; a defective one is not
+        if mult != len(vecs):
+            return None
+        diag += [lam] * mult
+        p_cols += vecs
+    # eigenvects() already simplified its output
+    return sp.Matrix.hstack(*p_cols), sp.diag(*diag)
 
 
 def main() -> None:
@@ -94,14 +137,15 @@ def main() -> None:
             sp.pprint(A, use_unicode=True)
 
             print("\nEigenvalues/eigenvectors (summary):")
-            for lam, mult, vecs in A.eigenvects():
+            A_key = A.as_immutable()
+            for lam, mult, vecs in eigen_triples(A_key):
                 print("\n" + "-" * 44)
                 print(f"λ = {sp.simplify(lam)}   (multiplicity = {mult})")
                 print("eigenvector basis:")
                 for v in vecs:
                     sp.pprint(v, use_unicode=True)
 
-            res = try_diagonalize(A)
+            res = try_diagonalize(A_key)
             if res is None:
                 print("\n❌ A is NOT diagonalizable (or SymPy could not diagonalize it).")
                 print("Tip: If your exam covers Jordan form, you could use A.jordan_form().")
@@ -114,10 +158,17 @@ def main() -> None:
                 print("\nD = (diagonal eigenvalue matrix)")
                 sp.pprint(D, use_unicode=True)
 
+                # rational spectrum (P, P^{-1} rational too): cancel per entry
+                # is enough; only radicals/complex values need full simplify
+                lams = [D[i, i] for i in range(D.rows)]
+                tidy = sp.cancel if all(lam.is_Rational for lam in lams) else sp.simplify
+
                 # Verification
-                Pinv = sp.simplify(P.inv())
-                check1 = sp.simplify(Pinv * A * P)
-                check2 = sp.simplify(P * D * Pinv)
+                # P^{-1} in closed form for n <= 3, otherwise one solve against I;
+                # check 1 solves P X = A P directly
+                Pinv = (_small_inv(P) if n <= 3 else P.solve(sp.eye(n))).applyfunc(tidy)
+                check1 = P.LUsolve(A * P).applyfunc(tidy)
+                check2 = (P * D * Pinv).applyfunc(tidy)
 
                 print("\nCheck 1: P^{-1} * A * P =")
                 sp.pprint(check1, use_unicode=True)
@@ -129,7 +180,9 @@ def main() -> None:
                 do_pow = input("\nCompute A^k using diagonalization? (y/n): ").strip().lower()
                 if do_pow == "y":
                     k = read_int("k (0..50): ", 0, 50)
-                    Ak = sp.simplify(P * (D ** k) * Pinv)
+                    # D is diagonal: raise the n entries instead of a matrix power
+                    Dk = sp.diag(*[lam ** k for lam in lams])
+                    Ak = (P * Dk * Pinv).applyfunc(tidy)
                     print(f"\nA^{k} =")
                     sp.pprint(Ak, use_unicode=True)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
+import re
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
@@ -13,10 +15,21 @@ class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+
+@lru_cache(maxsize=4096)
 def parse_num(s: str) -> sp.Rational:
     s = s.strip()
     if s == "":
         raise InputError("Empty input.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = s.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(s)  # supports -3, 1/2, 0.25
     except Exception:
@@ -47,27 +60,21 @@ def read_vector(n: int, name: str) -> sp.Matrix:
         txt = input(f"Enter vector {name} with {n} entries: ").strip()
         if txt.lower() in {"q", "quit", "back"}:
             raise KeyboardInterrupt
-        txt = txt.replace(",", " ")
-        parts = [p for p in txt.split() if p.strip() != ""]
+        parts = _TOK.findall(txt)
         if len(parts) != n:
             print(f"❌ Expected {n} numbers, got {len(parts)}.")
             print("   Example: 1, -2, 3, 4/5")
             continue
         try:
             nums = [parse_num(p) for p in parts]
-            return sp.Matrix(nums)
+            return sp.Matrix._new(n, 1, nums, copy=False)
         except InputError as e:
             print(f"❌ {e}")
 
 
 def norm(v: sp.Matrix) -> sp.Expr:
-    return sp.sqrt((v.T * v)[0])
-
-
-def distance(a: sp.Matrix, b: sp.Matrix) -> sp.Expr:
-    if a.shape != b.shape:
-        raise InputError(f"Shape mismatch: a is {a.shape}, b is {b.shape}")
-    return norm(a - b)
+    # plain sum of squares; no 1xn * nx1 matrix product
+    return sp.sqrt(sum((x * x for x in v), sp.S.Zero))
 
 
 def main() -> None:
@@ -84,8 +91,10 @@ def main() -> None:
             print("\na ="); sp.pprint(a, use_unicode=True)
             print("\nb ="); sp.pprint(b, use_unicode=True)
 
-            diff = sp.simplify(a - b)
-            d = sp.simplify(distance(a, b))
+            # entries are Rationals: a - b and its norm are already exact,
+            # so subtract once and reuse it for the distance
+            diff = a - b
+            d = norm(diff)
 
             print("\na - b ="); sp.pprint(diff, use_unicode=True)
             print(f"\n||a - b|| = {d}")
@@ -1,8 +1,14 @@
 from __future__ import annotations
+import io
+import re
 import sys
+from functools import lru_cache
 
 try:
     import sympy as sp
+    from sympy import QQ
+    from sympy.polys.matrices import DomainMatrix
+    from sympy.printing.pretty.pretty import PrettyPrinter
 except Exception as e:
     print("Could not import sympy. Install it first with: pip install sympy")
     print("Error:", e)
@@ -13,10 +19,24 @@ class InputError(Exception):
     pass
 
 
+_TOK = re.compile(r"[^\s,\[\]\(\)\{\}]+")
+
+# one shared printer instead of sp.pretty() building a new one per matrix
+_PP = PrettyPrinter({"use_unicode": True})
+
+
+@lru_cache(maxsize=4096)
 def parse_number(token: str) -> sp.Rational:
     token = token.strip()
     if token == "":
         raise InputError("Empty number.")
+    # fast path: plain integers and p/q fractions skip SymPy's string parser
+    num, slash, den = token.partition("/")
+    digits = num[1:] if num[:1] in ("+", "-") else num
+    if digits.isdecimal() and (not slash or den.isdecimal()):
+        q = int(den) if slash else 1
+        if q != 0:
+            return sp.Rational(int(num), q)
     try:
         return sp.Rational(token)  # supports -3, 1/2, 0.5
     except Exception:
@@ -24,11 +44,7 @@ def parse_number(token: str) -> sp.Rational:
 
 
 def parse_row(row_text: str, n: int) -> list[sp.Rational]:
-    s = row_text.strip()
-    for ch in "[](){}":
-        s = s.replace(ch, "")
-    s = s.replace(",", " ")
-    parts = [p for p in s.split() if p.strip() != ""]
+    parts = _TOK.findall(row_text)
     if len(parts) != n:
         raise InputError(f"Expected {n} numbers, got {len(parts)}.")
     return [parse_number(p) for p in parts]
@@ -52,28 +68,104 @@ def read_int(prompt: str, min_value: int = 1, max_value: int = 80) -> int:
 def read_matrix(m: int, n: int, name: str = "A") -> sp.Matrix:
     print(f"\nEnter matrix {name} row by row ({m} x {n}).")
     print("Separate numbers with spaces or commas. Fractions allowed (e.g. 1/3).")
-    rows = []
+    flat: list[sp.Rational] = []
     for i in range(m):
         while True:
             txt = input(f"{name} Row {i+1} (n={n}): ")
             if txt.lower() in {"q", "quit", "exit"}:
                 raise KeyboardInterrupt
             try:
-                rows.append(parse_row(txt, n))
+                flat.extend(parse_row(txt, n))
                 break
             except InputError as e:
                 print(f"❌ {e}")
                 print("Example row: 1, 2, -3, 4/5")
-    return sp.Matrix(rows)
+    # entries are already Rationals: hand the fresh flat list over without re-sympifying
+    return sp.Matrix._new(m, n, flat, copy=False)
 
 
 def nonzero_rows(M: sp.Matrix) -> list[sp.Matrix]:
-    rows = []
-    for i in range(M.rows):
-        r = M.row(i)
-        if any(r[0, j] != 0 for j in range(M.cols)):
-            rows.append(r)
-    return rows
+    # one tolist() pass instead of a row view plus indexed lookups per entry
+    return [sp.Matrix([row]) for row in M.tolist() if any(v != 0 for v in row)]
+
+
+def _nullspace_from_rref(R: sp.Matrix, pivots: tuple[int, ...]) -> list[tuple]:
+    # one basis vector per free column, read straight off the RREF:
+    # 1 in the free slot, -R[row, j] in each pivot slot
+    n = R.cols
+    basis = []
+    for j in range(n):
+        if j in pivots:
+            continue
+        v = [sp.S.Zero] * n
+        v[j] = sp.S.One
+        for row, p in enumerate(pivots):
+            v[p] = -R[row, j]
+        basis.append(tuple(v))
+    return basis
+
+
+def to_qq(M: sp.MatrixBase) -> DomainMatrix:
+    # exact rational domain: elimination on plain int pairs instead of Rational objects
+    return DomainMatrix.from_Matrix(M).convert_to(QQ)
+
+
+# one read -> compute -> print pass; main() owns the loop and the error handling
+def _one_round() -> None:
+    buf = io.StringIO()
+    m = read_int("Rows m: ", 1, 80)
+    n = read_int("Cols n: ", 1, 80)
+    A = read_matrix(m, n, "A")
+
+    print("\nA =", file=buf)
+    print(_PP.doprint(A), file=buf)
+
+    Ad = to_qq(A)
+    rrefAd, pivots = Ad.rref()
+    rrefA = rrefAd.to_Matrix()
+    rankA = len(pivots)
+    nullityA = n - rankA
+
+    print("\nRREF(A) =", file=buf)
+    print(_PP.doprint(rrefA), file=buf)
+    print("\nPivot columns (0-indexed):", pivots, file=buf)
+    print(f"rank(A) = {rankA}", file=buf)
+    print(f"nullity(A) = {nullityA}", file=buf)
+    print(f"rank + nullity = {rankA + nullityA} (should equal n = {n})", file=buf)
+
+    # Basis for Column Space: pivot columns of ORIGINAL A
+    col_basis = [A.col(j) for j in pivots]
+    print("\nBasis for Col(A) (pivot columns of ORIGINAL A):", file=buf)
+    if col_basis:
+        for i, v in enumerate(col_basis, start=1):
+            print(f"v{i} =", file=buf)
+            print(_PP.doprint(v), file=buf)
+    else:
+        print("{0} (only the zero vector)", file=buf)
+
+    # Basis for Row Space: nonzero rows of RREF(A)
+    row_basis = nonzero_rows(rrefA)
+    print("\nBasis for Row(A) (nonzero rows of RREF(A)):", file=buf)
+    if row_basis:
+        for i, r in enumerate(row_basis, start=1):
+            print(f"r{i} =", file=buf)
+            print(_PP.doprint(r), file=buf)
+    else:
+        print("{0} (only the zero vector)", file=buf)
+
+    # Basis for Null Space: nullspace vectors (full column rank -> only the zero vector)
+    ns = _nullspace_from_rref(rrefA, pivots) if nullityA else []
+    print("\nBasis for Null(A) (solutions to A*x = 0):", file=buf)
+    if ns:
+        # render the whole basis into one string, written in one go
+        buf.write("\n".join(
+            f"n{i} =\n{_PP.doprint(sp.Matrix(v))}" for i, v in enumerate(ns, start=1)
+        ) + "\n")
+    else:
+        print("{0} (only the zero vector)", file=buf)
+
+    # one write per run instead of many small ones
+    sys.stdout.write(buf.getvalue())
 
 
 def main() -> None:
@@ -81,55 +173,15 @@ def main() -> None:
     print("Outputs bases for Col(A), Row(A), Null(A), plus rank and nullity.")
     print("Type 'q' to quit.\n")
 
-    while True:
-        try:
-            m = read_int("Rows m: ", 1, 80)
-            n = read_int("Cols n: ", 1, 80)
-            A = read_matrix(m, n, "A")
-
-            print("\nA =")
-            sp.pprint(A, use_unicode=True)
-
-            rrefA, pivots = A.rref()
-            rankA = len(pivots)
-            nullityA = n - rankA
-
-            print("\nRREF(A) =")
-            sp.pprint(rrefA, use_unicode=True)
-            print("\nPivot columns (0-indexed):", pivots)
-            print(f"rank(A) = {rankA}")
-            print(f"nullity(A) = {nullityA}")
-            print(f"rank + nullity = {rankA + nullityA} (should equal n = {n})")
-
-            # Basis for Column Space: pivot columns of ORIGINAL A
-            col_basis = [A.col(j) for j in pivots]
-            print("\nBasis for Col(A) (pivot columns of ORIGINAL A):")
-            if col_basis:
-                for i, v in enumerate(col_basis, start=1):
-                    print(f"v{i} =")
-                    sp.pprint(v, use_unicode=True)
-            else:
-                print("{0} (only the zero vector)")
-
-            # Basis for Row Space: nonzero rows of RREF(A)
-            row_basis = nonzero_rows(rrefA)
-            print("\nBasis for Row(A) (nonzero rows of RREF(A)):")
-            if row_basis:
-                for i, r in enumerate(row_basis, start=1):
-                    print(f"r{i} =")
-                    sp.pprint(r, use_unicode=True)
-            else:
-                print("{0} (only the zero vector)")
-
-            # Basis for Null Space: nullspace vectors
-            ns = A.nullspace()
-            print("\nBasis for Null(A) (solutions to A*x = 0):")
-            if ns:
-                for i, v in enumerate(ns, start=1):
-                    print(f"n{i} =")
-                    sp.pprint(v, use_unicode=True)
-            else:
-                print("{0} (only the zero vector)")
+    # KeyboardInterrupt ('q' or Ctrl+C) is handled once, outside the loop
+    try:
+        while True:
+            try:
+                _one_round()
+            except Exception as e:
+                print("\n💥 Unexpected error (program continues):", repr(e))
+                input("Press Enter to continue...")
+                continue
 
             again = input("\nRun again? (Enter=yes, q=no): ").strip().lower()
             if again in {"q", "quit", "no", "n"}:
@@ -137,12 +189,8 @@ def main() -> None:
                 return
             print()
 
-        except KeyboardInterrupt:
-            print("\nBye!")
-            return
-        except Exception as e:
-            print("\n💥 Unexpected error (program continues):", repr(e))
-            input("Press Enter to continue...")
+    except KeyboardInterrupt:
+        print("\nBye!")
 
 
 if __name__ == "__main__":